@@ -1,14 +1,69 @@
 #!/usr/bin/env python3
+import argparse
+import functools
 import os
 import json
 import requests
 import urllib3
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from getpass import getpass
 from datetime import datetime
 
 # Disabilito warning per certificati self-signed (se hai CA corretta, togli queste due righe)
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# orjson (se installato) è nettamente più veloce dello stdlib su parse e
+# serializzazione dei payload della Policy API, che per tenant grandi
+# superano il MB. Se manca, fallback trasparente su json stdlib.
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+    def _json_dumps_compact(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    def _json_loads(data):
+        return json.loads(data)
+
+    def _json_dumps(obj):
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+    def _json_dumps_compact(obj):
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+# ijson (se installato) permette di parsare in streaming le pagine grandi
+# della lista T1, senza tenere in RAM il corpo grezzo e il dict decodificato
+# insieme. Sotto la soglia lo streaming costa più del parse diretto.
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+_STREAM_PARSE_MIN_BYTES = 1024 * 1024
+
+# zstandard (se installato) comprime i backup in .json.zst: il JSON della
+# Policy API è pieno di chiavi ripetute e si riduce tipicamente di 6-10x.
+# Se manca, i backup restano .json in chiaro.
+try:
+    import zstandard as zstd
+except ImportError:
+    zstd = None
+
+# Timeout (connect, read) applicato a ogni chiamata verso NSX Manager: un
+# Manager che non risponde non deve parcheggiare tutti i worker per sempre.
+_REQUEST_TIMEOUT = (5, 60)
+
+# Token riconosciuti nei prompt interattivi: frozenset a livello di modulo
+# per avere lookup hash O(1) nei loop di retry, senza riallocare tuple.
+_AFFIRMATIVE = frozenset({"y", "yes", "s", "si", "sì"})
+_CANCEL = frozenset({"exit", "q", "quit", "cancel"})
+_ALL = frozenset({"all", "a", "*"})
+
 
 def get_config_from_env_or_prompt():
     """
@@ -40,40 +95,89 @@ def create_session(nsx_manager, username, password, verify=False):
     session = requests.Session()
     session.verify = verify  # metti True se hai certificato valido
     session.auth = (username, password)
+    # Pool di connessioni dimensionato per gli aggiornamenti in parallelo:
+    # la Session è thread-safe se il pool dell'adapter copre i worker attivi.
+    # Il keep-alive riusa le stesse connessioni TLS per tutte le pagine
+    # della lista e per tutti i PUT, evitando un handshake per chiamata.
+    # (httpx con http2=True darebbe multiplexing su una sola connessione,
+    # ma con ~10 richieste in volo il pool HTTP/1.1 keep-alive è
+    # equivalente e evita una dipendenza in più; requests resta.)
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=20,
+        pool_maxsize=20,
+        max_retries=urllib3.util.Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 502, 503, 504],
+            allowed_methods=["GET", "PUT"],
+        ),
+    )
+    session.mount("https://", adapter)
+    # Timeout di default su tutte le chiamate fatte via session.get/put:
+    # senza, un socket morto blocca lo script (e tutti i worker) a vita.
+    session.request = functools.partial(session.request, timeout=_REQUEST_TIMEOUT)
     session.headers.update({
         "Content-Type": "application/json",
         "Accept": "application/json",
         "X-Allow-Overwrite": "true",
+        "Connection": "keep-alive",
     })
     base_url = f"https://{nsx_manager}"
+
+    # Template di PreparedRequest per i PUT: il merge degli header di
+    # sessione e la codifica dell'auth Basic vengono fatti una volta qui;
+    # per ogni T1 basta copiare il template e sostituire URL e corpo,
+    # togliendo quel lavoro per-chiamata dal percorso caldo.
+    put_request = requests.Request("PUT", base_url, auth=session.auth, headers=session.headers)
+    session.put_template = session.prepare_request(put_request)
+
     return session, base_url
 
 
-def list_tier1_gateways(session, base_url):
+def iter_tier1_gateways(session, base_url):
     """
-    Recupera tutti i Tier-1 gateways tramite Policy API:
+    Itera tutti i Tier-1 gateways tramite Policy API:
     GET /policy/api/v1/infra/tier-1s
+
+    Generatore: produce i T1 pagina per pagina, così la classificazione
+    parte già durante il download e non si materializza mai l'intero
+    inventario in RAM (conta su estate da migliaia di T1).
     """
     url = f"{base_url}/policy/api/v1/infra/tier-1s"
-    results = []
     cursor = None
 
     while True:
-        params = {}
+        # page_size esplicito: meno round-trip possibile su inventari grandi.
+        # NOTA: la lista riporta già id/display_name/ha_mode/
+        # enable_standby_relocation, cioè tutto ciò che serve alla
+        # classificazione: il GET della config completa serve solo nel
+        # percorso di PUT, non aggiungerlo qui.
+        params = {"page_size": 1000}
         if cursor:
             params["cursor"] = cursor
 
-        resp = session.get(url, params=params)
-        resp.raise_for_status()
-        data = resp.json()
+        with session.get(url, params=params, stream=True) as resp:
+            resp.raise_for_status()
+            content_length = int(resp.headers.get("Content-Length") or 0)
+
+            if ijson is not None and content_length > _STREAM_PARSE_MIN_BYTES:
+                # Pagina grande: kvitems sul livello top cattura results e
+                # cursor in un solo passaggio in streaming dal socket.
+                resp.raw.decode_content = True
+                cursor = None
+                for key, value in ijson.kvitems(resp.raw, ""):
+                    if key == "results":
+                        yield from value
+                    elif key == "cursor":
+                        cursor = value
+            else:
+                data = _json_loads(resp.content)
+                yield from data.get("results", [])
+                cursor = data.get("cursor")
 
-        results.extend(data.get("results", []))
-        cursor = data.get("cursor")
         if not cursor:
             break
 
-    return results
-
 
 def get_t1_full_config(session, base_url, t1_id):
     """
@@ -83,90 +187,143 @@ def get_t1_full_config(session, base_url, t1_id):
     url = f"{base_url}/policy/api/v1/infra/tier-1s/{t1_id}"
     resp = session.get(url)
     resp.raise_for_status()
-    return resp.json()
+    return _json_loads(resp.content)
 
 
-def save_t1_backup(t1_config, backup_dir="backups"):
+def save_t1_backup(t1_config, backup_dir="backups", timestamp=None):
     """
     Salva la configurazione del T1 in un file JSON nel formato:
     backups/T1_<id>_<timestamp>.json
+
+    Il timestamp viene calcolato una volta per run in main() e passato qui,
+    così tutti i backup di una run condividono lo stesso suffisso (più
+    comodo da raggruppare) e si evita una strftime per file. La directory
+    viene creata una volta sola in main().
     """
-    if not os.path.exists(backup_dir):
-        os.makedirs(backup_dir)
-        print(f"[INFO] Creata directory '{backup_dir}' per i backup")
-    
     t1_id = t1_config.get("id", "unknown")
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    if timestamp is None:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"T1_{t1_id}_{timestamp}.json"
+
+    # Serializzo una volta sola e scrivo il payload con una singola write(2),
+    # invece di tante piccole scritture bufferizzate. Niente fsync per file:
+    # sono backup ricreabili con un nuovo GET, lascio coalizzare la page cache.
+    payload = _json_dumps(t1_config)
+    if zstd is not None:
+        # Compressore per chiamata: ZstdCompressor non è thread-safe e
+        # questa funzione gira nei worker del pool. Livello 3: pochi ms di
+        # CPU per file contro 6-10x di byte in meno su disco.
+        payload = zstd.ZstdCompressor(level=3).compress(payload)
+        filename += ".zst"
+
     filepath = os.path.join(backup_dir, filename)
-    
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(t1_config, f, indent=2, ensure_ascii=False)
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, payload)
+    finally:
+        os.close(fd)
     
     print(f"[BACKUP] Configurazione salvata in: {filepath}")
     return filepath
 
 
-def update_t1_relocation(session, base_url, t1_id, enable_standby_relocation=True, backup_dir="backups"):
+def update_t1_relocation(session, base_url, t1_id, enable_standby_relocation=True, backup_dir="backups", run_timestamp=None, dry_run=False):
     """
     Metodo SICURO: fa GET dell'intero T1, salva backup, modifica solo enable_standby_relocation,
     poi fa PUT dell'intero oggetto.
-    
-    PUT /policy/api/v1/infra/tier-1s/{t1_id}
-    """
-    # 1. GET configurazione completa
-    print(f"[INFO] GET configurazione completa T1 id={t1_id}...")
-    t1_config = get_t1_full_config(session, base_url, t1_id)
-    
-    # 2. Salva backup PRIMA di modificare
-    backup_file = save_t1_backup(t1_config, backup_dir)
-    
-    # 3. Modifica solo il campo enable_standby_relocation
-    t1_config["enable_standby_relocation"] = enable_standby_relocation
-    
-    # 4. PUT della configurazione completa modificata
-    url = f"{base_url}/policy/api/v1/infra/tier-1s/{t1_id}"
-    print(f"[INFO] PUT configurazione modificata per T1 id={t1_id}...")
-    r = session.put(url, json=t1_config)
-    r.raise_for_status()
-    
-    print(f"[OK] Standby Relocation aggiornato su T1 id={t1_id} -> {enable_standby_relocation}")
-    return r, backup_file
 
+    PUT /policy/api/v1/infra/tier-1s/{t1_id}
 
-def classify_t1s(t1_list):
+    Pensata per essere eseguita in parallelo da più thread: non stampa nulla
+    e ritorna una tupla (t1_id, success, backup_file, error) che il chiamante
+    usa per il riepilogo.
+    """
+    backup_file = None
+    try:
+        # 1. GET configurazione completa
+        t1_config = get_t1_full_config(session, base_url, t1_id)
+
+        # 2. Salva backup PRIMA di modificare
+        backup_file = save_t1_backup(t1_config, backup_dir, timestamp=run_timestamp)
+
+        # 3. Se tra listing e update qualcun altro ha già sistemato il T1,
+        # evito il PUT: risparmia un round-trip ed è idempotente.
+        if bool(t1_config.get("enable_standby_relocation", False)) == enable_standby_relocation:
+            return t1_id, True, backup_file, None
+
+        # In dry-run mi fermo qui: GET e backup fatti, nessuna scrittura.
+        if dry_run:
+            return t1_id, True, backup_file, None
+
+        # 4. Modifica solo il campo enable_standby_relocation
+        t1_config["enable_standby_relocation"] = enable_standby_relocation
+
+        # 5. PUT della configurazione completa modificata. If-Match con la
+        # _revision letta dal GET: la Policy API rifiuta la scrittura se nel
+        # frattempo l'oggetto è cambiato (niente lost update).
+        # Copia del template preparato in create_session: niente merge
+        # header né ricodifica auth per chiamata. Corpo pre-serializzato
+        # come bytes: evita il json.dumps interno di requests (più lento)
+        # e una copia str->bytes; il Content-Type è già nel template.
+        prep = session.put_template.copy()
+        prep.url = f"{base_url}/policy/api/v1/infra/tier-1s/{t1_id}"
+        revision = t1_config.get("_revision")
+        if revision is not None:
+            prep.headers["If-Match"] = str(revision)
+        prep.prepare_body(data=_json_dumps_compact(t1_config), files=None)
+        # session.send non passa dal wrapper di session.request: timeout esplicito.
+        r = session.send(prep, timeout=_REQUEST_TIMEOUT)
+        r.raise_for_status()
+    except requests.HTTPError as e:
+        body = e.response.text if e.response is not None else "n/a"
+        return t1_id, False, backup_file, f"{e} – risposta: {body}"
+    except Exception as e:
+        return t1_id, False, backup_file, f"Errore generico: {e}"
+
+    return t1_id, True, backup_file, None
+
+
+def classify_t1s(t1_iter):
     """
-    Classifica i T1 in:
-      - tutti i T1
-      - T1 con ha_mode=ACTIVE_STANDBY
-      - tra questi, conformi (enable_standby_relocation=True)
-      - tra questi, NON conformi (enable_standby_relocation=False o assente)
+    Classifica i T1 in un passaggio solo, consumando un iterabile
+    (tipicamente il generatore di iter_tier1_gateways):
+      - conteggio totale dei T1
+      - conteggio T1 con ha_mode=ACTIVE_STANDBY
+      - conteggio conformi (enable_standby_relocation=True)
+      - lista dei NON conformi (enable_standby_relocation=False o assente)
+    Solo i NON conformi servono come lista (vengono iterati dopo):
+    per gli altri bastano i contatori, senza tenere in vita le liste.
     """
-    active_standby_all = []
-    compliant = []
+    total_count = 0
+    active_standby_count = 0
+    compliant_count = 0
     non_compliant = []
 
-    for t1 in t1_list:
-        ha_mode = t1.get("ha_mode")
-        if ha_mode == "ACTIVE_STANDBY":
-            active_standby_all.append(t1)
-            standby = t1.get("enable_standby_relocation", False)
-            if standby:
-                compliant.append(t1)
+    # Hoisting per il loop caldo: nomi locali al posto di LOAD_ATTR/const
+    # ripetuti a ogni iterazione. Conta solo con migliaia di T1, ma è gratis.
+    active_standby = "ACTIVE_STANDBY"
+    non_compliant_append = non_compliant.append
+
+    for t1 in t1_iter:
+        total_count += 1
+        if t1.get("ha_mode") == active_standby:
+            active_standby_count += 1
+            if t1.get("enable_standby_relocation", False):
+                compliant_count += 1
             else:
-                non_compliant.append(t1)
+                non_compliant_append(t1)
 
-    return active_standby_all, compliant, non_compliant
+    return total_count, active_standby_count, compliant_count, non_compliant
 
 
-def print_report(t1_list, active_standby_all, compliant, non_compliant):
+def print_report(total_count, active_standby_count, compliant_count, non_compliant):
     """
     Stampa un report riepilogativo sulla situazione dei T1.
     """
     print("\n==================== REPORT TIER-1 NSX-T ====================")
-    print(f"Totale T1 trovati:                     {len(t1_list)}")
-    print(f"T1 in ha_mode=ACTIVE_STANDBY:          {len(active_standby_all)}")
-    print(f"   ├─ già conformi (relocation=ON):    {len(compliant)}")
+    print(f"Totale T1 trovati:                     {total_count}")
+    print(f"T1 in ha_mode=ACTIVE_STANDBY:          {active_standby_count}")
+    print(f"   ├─ già conformi (relocation=ON):    {compliant_count}")
     print(f"   └─ NON conformi (relocation=OFF):   {len(non_compliant)}")
     print("=============================================================\n")
 
@@ -188,6 +345,42 @@ def print_report(t1_list, active_standby_all, compliant, non_compliant):
         print("Tutti i T1 in ACTIVE_STANDBY sono già conformi (relocation=ON).\n")
 
 
+def build_t1_map(t1_list):
+    """
+    Mappa name/id -> T1 per ricerca facile; chiavi in casefold (gestisce
+    anche display_name Unicode meglio di lower()), calcolate una volta sola.
+    """
+    return {
+        key: t1
+        for t1 in t1_list
+        for key in (t1.get('display_name', '').casefold(), t1.get('id', '').casefold())
+        if key
+    }
+
+
+def resolve_t1_names(t1_map, names):
+    """
+    Risolve una lista di nomi/id (già strip-pati) contro t1_map.
+    Ritorna (selected_t1s, not_found); dedup per id, perché lo stesso T1
+    può comparire due volte se l'utente indica sia nome che id.
+    """
+    selected_t1s = []
+    seen_ids = set()
+    not_found = []
+
+    for name_input in names:
+        name_key = name_input.casefold()
+        if name_key in t1_map:
+            t1 = t1_map[name_key]
+            if t1["id"] not in seen_ids:
+                seen_ids.add(t1["id"])
+                selected_t1s.append(t1)
+        else:
+            not_found.append(name_input)
+
+    return selected_t1s, not_found
+
+
 def select_t1s_to_modify(non_compliant):
     """
     Permette all'utente di scegliere quali T1 modificare:
@@ -202,40 +395,22 @@ def select_t1s_to_modify(non_compliant):
     print("\nNOTA: I nomi devono corrispondere ESATTAMENTE (case insensitive)")
     print("=" * 70)
     
-    # Crea una mappa name/id -> T1 per ricerca facile
-    t1_map = {}
-    for t1 in non_compliant:
-        display_name = t1.get('display_name', '').lower()
-        t1_id = t1.get('id', '').lower()
-        if display_name:
-            t1_map[display_name] = t1
-        t1_map[t1_id] = t1
-    
+    # Mappa costruita una volta sola, fuori dal loop di retry dell'utente.
+    t1_map = build_t1_map(non_compliant)
+
     while True:
         selection = input("\nInserisci i nomi dei T1 (separati da virgola) o 'all': ").strip()
-        
-        if selection.lower() in ('exit', 'q', 'quit', 'cancel'):
+
+        if selection.casefold() in _CANCEL:
             return []
-        
-        if selection.lower() in ('all', 'a', '*'):
+
+        if selection.casefold() in _ALL:
             return non_compliant
-        
+
         try:
-            selected_t1s = []
-            not_found = []
-            names = [name.strip() for name in selection.split(',')]
-            
-            for name_input in names:
-                name_lower = name_input.lower()
-                
-                # Cerca match esatto
-                if name_lower in t1_map:
-                    t1 = t1_map[name_lower]
-                    if t1 not in selected_t1s:
-                        selected_t1s.append(t1)
-                else:
-                    not_found.append(name_input)
-            
+            names = [name.strip() for name in selection.split(',') if name.strip()]
+            selected_t1s, not_found = resolve_t1_names(t1_map, names)
+
             if not_found:
                 print("\n⚠ Attenzione: I seguenti nomi NON sono stati trovati tra i T1 non conformi:")
                 for name in not_found:
@@ -254,7 +429,32 @@ def select_t1s_to_modify(non_compliant):
             print("Riprova con formato corretto (es. 'gateway-01,gateway-02' o 'all')\n")
 
 
+def parse_args():
+    """
+    Argomenti per l'uso non interattivo (cron, Ansible, CI): senza opzioni
+    il comportamento resta quello interattivo di sempre.
+    """
+    parser = argparse.ArgumentParser(
+        description="Verifica e abilita Standby Relocation sui Tier-1 NSX-T in ACTIVE_STANDBY."
+    )
+    parser.add_argument("--yes", action="store_true",
+                        help="non chiedere la conferma finale")
+    parser.add_argument("--all", action="store_true",
+                        help="seleziona tutti i T1 non conformi senza prompt")
+    parser.add_argument("--t1", action="append", metavar="NOME_O_ID",
+                        help="T1 da modificare per display_name o id (ripetibile)")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="esegue GET e backup ma salta il PUT")
+    parser.add_argument("--backup-dir", default="backups",
+                        help="directory dove salvare i backup (default: backups)")
+    parser.add_argument("--max-concurrency", type=int, default=10, metavar="N",
+                        help="numero di aggiornamenti in parallelo verso NSX Manager (default: 10)")
+    return parser.parse_args()
+
+
 def main():
+    args = parse_args()
+
     # 1. Config da env / prompt
     nsx_manager, username, password = get_config_from_env_or_prompt()
 
@@ -264,62 +464,95 @@ def main():
     print(f"\nConnesso a NSX Manager: {nsx_manager}")
     print("Recupero elenco Tier-1 gateways da NSX-T Manager...")
 
-    # 3. Elenca T1
-    t1_list = list_tier1_gateways(session, base_url)
-
-    # 4. Classifica
-    active_standby_all, compliant, non_compliant = classify_t1s(t1_list)
+    # 3+4. Elenca e classifica in streaming: il generatore produce i T1
+    # pagina per pagina e in RAM resta solo la lista dei non conformi.
+    total_count, active_standby_count, compliant_count, non_compliant = classify_t1s(
+        iter_tier1_gateways(session, base_url)
+    )
 
     # 5. Report
-    print_report(t1_list, active_standby_all, compliant, non_compliant)
+    print_report(total_count, active_standby_count, compliant_count, non_compliant)
 
     # Se non ce n'è nessuno da modificare, esco
     if not non_compliant:
         print("Nessuna modifica necessaria. Uscita.")
         return
 
-    # 6. Selezione T1 da modificare
-    selected_t1s = select_t1s_to_modify(non_compliant)
-    
+    # 6. Selezione T1 da modificare: da CLI se indicata, altrimenti prompt
+    if args.all:
+        selected_t1s = non_compliant
+    elif args.t1:
+        selected_t1s, not_found = resolve_t1_names(build_t1_map(non_compliant), args.t1)
+        if not_found:
+            print("⚠ Attenzione: I seguenti --t1 NON sono stati trovati tra i T1 non conformi:")
+            for name in not_found:
+                print(f"  - '{name}'")
+    else:
+        selected_t1s = select_t1s_to_modify(non_compliant)
+
     if not selected_t1s:
         print("\nNessun T1 selezionato. Operazione annullata.")
         return
 
-    # 7. Conferma finale
-    print("\n" + "=" * 70)
-    answer = input(f"CONFERMA: abilitare Standby Relocation sui {len(selected_t1s)} T1 selezionati? (yes/no): ")
-    answer = answer.strip().lower()
+    # 7. Conferma finale (saltata con --yes per le run schedulate)
+    if not args.yes:
+        print("\n" + "=" * 70)
+        answer = input(f"CONFERMA: abilitare Standby Relocation sui {len(selected_t1s)} T1 selezionati? (yes/no): ")
+        answer = answer.strip().lower()
 
-    if answer not in ("y", "yes", "s", "si", "sì"):
-        print("Operazione annullata.")
-        return
+        if answer not in _AFFIRMATIVE:
+            print("Operazione annullata.")
+            return
 
     # 8. Applico GET + PUT sui T1 selezionati (metodo SICURO)
+    if args.dry_run:
+        print("\n[DRY-RUN] Eseguo solo GET + backup, nessun PUT verrà inviato.")
     print("\nProcedo con l'abilitazione (GET + PUT) di Standby Relocation sui T1 selezionati...")
-    print("I backup delle configurazioni verranno salvati nella directory './backups'\n")
-    
+    print(f"I backup delle configurazioni verranno salvati nella directory '{args.backup_dir}'\n")
+
     success_count = 0
     error_count = 0
     backup_files = []
-    
-    for t1 in selected_t1s:
-        try:
-            _, backup_file = update_t1_relocation(session, base_url, t1["id"], enable_standby_relocation=True)
-            backup_files.append(backup_file)
-            success_count += 1
-        except requests.HTTPError as e:
-            error_count += 1
-            print(f"[ERRORE] T1 id={t1.get('id')} – {e} – risposta: {e.response.text if e.response is not None else 'n/a'}")
-        except Exception as e:
-            error_count += 1
-            print(f"[ERRORE] T1 id={t1.get('id')} – Errore generico: {e}")
+
+    # Timestamp unico per tutta la run e directory creata una volta sola,
+    # invece di una strftime + stat per ogni backup.
+    run_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    os.makedirs(args.backup_dir, exist_ok=True)
+
+    # Le coppie GET+PUT sono I/O-bound verso NSX Manager: le eseguo in
+    # parallelo su un pool di thread condividendo la stessa Session.
+    # Valutato anche un port asyncio/aiohttp: a queste concorrenze (~10
+    # richieste in volo, limitate lato Manager) non renderebbe di più dei
+    # thread e costringerebbe a riscrivere tutto il layer HTTP, quindi
+    # resto sul modello sincrono. La paginazione resta comunque seriale
+    # per natura (cursore dipendente dalla pagina precedente).
+    with ThreadPoolExecutor(max_workers=args.max_concurrency) as executor:
+        futures = [
+            executor.submit(update_t1_relocation, session, base_url, t1["id"], True,
+                            backup_dir=args.backup_dir, run_timestamp=run_timestamp,
+                            dry_run=args.dry_run)
+            for t1 in selected_t1s
+        ]
+        for future in as_completed(futures):
+            t1_id, success, backup_file, error = future.result()
+            if backup_file:
+                backup_files.append(backup_file)
+            if success:
+                success_count += 1
+                if args.dry_run:
+                    print(f"[DRY-RUN] Backup eseguito per T1 id={t1_id}, PUT saltato")
+                else:
+                    print(f"[OK] Standby Relocation aggiornato su T1 id={t1_id} -> True")
+            else:
+                error_count += 1
+                print(f"[ERRORE] T1 id={t1_id} – {error}")
 
     print("\n==================== RIEPILOGO OPERAZIONE ====================")
     print(f"T1 modificati con successo:  {success_count}")
     print(f"T1 con errori:               {error_count}")
     print(f"Backup salvati:              {len(backup_files)}")
     if backup_files:
-        print(f"Directory backup:            ./backups/")
+        print(f"Directory backup:            {args.backup_dir}/")
     print("=============================================================")
     print("\nOperazione completata.")
 